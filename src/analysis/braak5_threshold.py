@@ -15,25 +15,28 @@ import argparse
 import numpy as np
 import matplotlib.pyplot as plt
 
-from src.models.tau_concentration_models import c_curves
-from src.data.preprocessing import braak
+from src.models._cache import cached_c_curves
+from src.data.preprocessing import braak_avg
 
 
 # === Main Function Returning Activation Time for Braak V and the Global Concentration at that Time ===
 def analyse_braak5_activation(
-        activation_threshold: float = 0.15,
+        activation_thresholds: float | np.ndarray = 0.15,
         c0: float = 0.1,
         l0: float = 0.5,
         tmax: int = 200,
-        plot: bool = False
-) -> tuple[float, float]:
+        plot: bool = False,
+        use_tex: bool = False
+) -> tuple[float | np.ndarray, float | np.ndarray]:
     """
-    Analyse the time and global tau load at which Braak stage V reaches a given threshold.
+    Analyse the time and global tau load at which Braak stage V reaches one or more thresholds.
+
+    The model is integrated once and every threshold is looked up on the same curve.
 
     Parameters
     ----------
-    activation_threshold : float, optional
-        Local concentration threshold for Braak V to be considered "activated". Default is 0.15.
+    activation_thresholds : float or array_like, optional
+        Local concentration threshold(s) for Braak V to be considered "activated". Default is 0.15.
     c0 : float, optional
         Initial tau concentration at seeded nodes. Default is 0.1.
     l0 : float, optional
@@ -42,16 +45,19 @@ def analyse_braak5_activation(
         Maximum simulation time (years). Default is 200.
     plot : bool, optional
         Whether to show a plot of the concentration dynamics. Default is False.
+    use_tex : bool, optional
+        Whether to render the plot text with LaTeX (slow) instead of mathtext. Default is False.
 
     Returns
     -------
-    arrival_time : float
-        Time (years) at which Braak V exceeds the threshold.
-    total_c_at_activation : float
-        Normalised total tau concentration at that time.
+    arrival_time : float or np.ndarray
+        Time (years) at which Braak V exceeds each threshold, zero if it never does. A float if
+        a single threshold was given, otherwise an array with one entry per threshold.
+    total_c_at_activation : float or np.ndarray
+        Normalised total tau concentration at those times.
     """
     # Simulate the tau propagation across the brain network under a growth-dominated regime with clearance enabled
-    t, c, c_total, l = c_curves(
+    t, c, c_total, l = cached_c_curves(
         c0=c0,
         tmax=tmax,
         l0=l0,
@@ -63,26 +69,33 @@ def analyse_braak5_activation(
     scaled_c_total = c_total / np.max(c_total)
 
     # Compute mean concentration across Braak V nodes
-    braak5_nodes = np.array(braak[4]) - 1
-    c_braak5 = c[:, braak5_nodes]
-    c_braak5_mean = np.mean(c_braak5, axis=1)
-
-    # Compute activation time and global load at activation
-    arrival_idx = np.argmax(c_braak5_mean > activation_threshold)
+    c_braak5_mean = c @ braak_avg[4]
+
+    # Compute activation time and global load at activation for every threshold at once
+    thresholds = np.atleast_1d(np.asarray(activation_thresholds, dtype=float))
+    if np.all(np.diff(c_braak5_mean) >= -1e-12):
+        # Monotonic growth: locate the first crossings by binary search
+        arrival_idx = np.searchsorted(c_braak5_mean, thresholds, side="right")
+        arrival_idx[arrival_idx == len(c_braak5_mean)] = 0  # Never activated, reported as a zero arrival time like the scan below
+    else:
+        arrival_idx = np.argmax(c_braak5_mean[None, :] > thresholds[:, None], axis=1)
     arrival_time = t[arrival_idx]
     total_c_at_activation = scaled_c_total[arrival_idx]
+    if np.ndim(activation_thresholds) == 0:
+        arrival_time, total_c_at_activation = arrival_time[0], total_c_at_activation[0]
 
     # Plot concentration curve with activation threshold
     if plot:
-        plt.rc("text", usetex=True)
+        plt.rc("text", usetex=use_tex)
         plt.rc("font", family="serif")
         plt.rcParams.update({"font.size": 19})
         fig, ax = plt.subplots(1, 1)
         ax.set_facecolor("#d9e9f9")
         ax.grid(color="white", linestyle='-', linewidth=1)
         ax.plot(t, c_braak5_mean, label="Braak V mean concentration")
-        ax.axhline(y=activation_threshold, color="red", linestyle="--", label="Threshold")
-        ax.axvline(x=arrival_time, color="gray", linestyle=":", label="Arrival time")
+        for k, (threshold, time) in enumerate(zip(thresholds, np.atleast_1d(arrival_time))):
+            ax.axhline(y=threshold, color="red", linestyle="--", label="Threshold" if k == 0 else None)
+            ax.axvline(x=time, color="gray", linestyle=":", label="Arrival time" if k == 0 else None)
         ax.legend()
         ax.set_xlabel("Time (years)")
         ax.set_ylabel("Concentration")
@@ -96,8 +109,8 @@ def analyse_braak5_activation(
 
 def main():
     parser = argparse.ArgumentParser(description="Analyse Braak V activation timing and global tau load.")
-    parser.add_argument("--threshold", type=float, default=0.15,
-                        help="Concentration threshold for Braak V activation (default: 0.15)")
+    parser.add_argument("--threshold", type=float, nargs="+", default=[0.15],
+                        help="Concentration threshold(s) for Braak V activation (default: 0.15)")
     parser.add_argument("--c0", type=float, default=0.1,
                         help="Initial tau concentration at seeded nodes (default: 0.1)")
     parser.add_argument("--l0", type=float, default=0.5,
@@ -106,22 +119,27 @@ def main():
                         help="Maximum simulation time in years (default: 200)")
     parser.add_argument("--plot", action="store_true",
                         help="Show plot of concentration and activation threshold")
+    parser.add_argument("--latex", action="store_true",
+                        help="Render plot text with LaTeX")
     args = parser.parse_args()
 
-    arrival_time, total_c = analyse_braak5_activation(
-        activation_threshold=args.threshold,
+    arrival_times, total_cs = analyse_braak5_activation(
+        activation_thresholds=np.array(args.threshold),
         c0=args.c0,
         l0=args.l0,
         tmax=args.tmax,
-        plot=args.plot
+        plot=args.plot,
+        use_tex=args.latex
     )
 
     # Report
-    if arrival_time == 0:
-        print("Braak V activation time is larger than `tmax`. Please increase its value or use the default")
-    else:
-        print(f"🧠 Arrival time for Braak V activation: {arrival_time:.2f} years")
-    print(f"📊 Global tau load at that time: {total_c * 100:.1f}%")
+    for threshold, arrival_time, total_c in zip(args.threshold, arrival_times, total_cs):
+        print(f"--- Threshold {threshold:g} ---")
+        if arrival_time == 0:
+            print("Braak V activation time is larger than `tmax`. Please increase its value or use the default")
+        else:
+            print(f"🧠 Arrival time for Braak V activation: {arrival_time:.2f} years")
+        print(f"📊 Global tau load at that time: {total_c * 100:.1f}%")
     print("📚 Expected: Braak V activates at 60–80% total concentration (Jack curves)")
 
 
@@ -13,21 +13,21 @@ Date: 2024-04
 # === Imports ===
 import argparse
 import numpy as np
+import numexpr as ne
 from pathlib import Path
 import matplotlib.pyplot as plt
 
-# Import FKPP simulation function
-from src.models.tau_concentration_models import c_curves
+# Import (cached) FKPP simulation function
+from src.models._cache import cached_c_curves
+from src.data.preprocessing import nv
 
 # === Plotting settings ===
-plt.rc('text', usetex=True)
-plt.rc('font', family='serif')
-plt.rcParams.update({'font.size': 19})
 colorcitos1 = iter(['#dc3e04', '#451ddc', '#01dc04', '#dc01d9', '#000000', '#ffa11b', '#1a7c25'])
 colorcitos2 = iter(['#dc3e04', '#451ddc', '#01dc04', '#dc01d9', '#000000', '#ffa11b', '#1a7c25'])
 
 
-def phaseplot(alpha=2.1, rho=0.01, l_crit=0.72, l_inf=0.01, l0_crit=1.4, beta=1, show_pcrit=True, save=False):
+def phaseplot(alpha=2.1, rho=0.01, l_crit=0.72, l_inf=0.01, l0_crit=1.4, beta=1, show_pcrit=True, save=False,
+              use_tex=False):
     """
     Plot the phase plane with streamlines for misfolded tau concentration and clearance.
 
@@ -57,43 +57,51 @@ def phaseplot(alpha=2.1, rho=0.01, l_crit=0.72, l_inf=0.01, l0_crit=1.4, beta=1,
         each converges to a different steady state. Default is True.
     save : bool, optional
         If True, saves the figure to `output_path`. Default is False.
+    use_tex : bool, optional
+        If True, text is rendered with LaTeX (slow) instead of mathtext. Default is False.
     """
     # Set up a meshgrid and the derivatives for the streamplot
     l_vals, c_vals = np.meshgrid(np.linspace(0, 1.5, 200), np.linspace(0, 1, 200))
 
-    def dcdt(c, l):
-        return (l_crit - l_vals) * c_vals - alpha * c_vals**2
-    def dldt(c, l):
-     return beta * c_vals * (l_inf - l_vals)
+    # Each derivative is evaluated in a single fused pass over the grid
+    U = ne.evaluate("(l_crit - l_vals) * c_vals - alpha * c_vals**2")    # dc/dt
+    V = ne.evaluate("beta * c_vals * (l_inf - l_vals)")                  # dl/dt
 
-    U = dcdt(c_vals, l_vals)
-    V = dldt(c_vals, l_vals)
+    # Plotting settings
+    plt.rc('text', usetex=use_tex)
+    plt.rc('font', family='serif')
+    plt.rcParams.update({'font.size': 19})
 
     # Initialise plot
     fig, ax = plt.subplots(1, 1, figsize=(11, 7))
 
-    ax.streamplot(l_vals, c_vals, V, U, color="#451ddc")
+    # Rasterise the stream field, which otherwise becomes thousands of vector paths
+    stream = ax.streamplot(l_vals, c_vals, V, U, color="#451ddc")
+    stream.lines.set_rasterized(True)
+    stream.arrows.set_rasterized(True)
     if show_pcrit:
         # Seed with p_crit
         c0_crit = ((alpha * (l_crit - l0_crit) +
                    beta * (l_inf - l_crit) +
                    beta * (l0_crit - l_inf) ** (alpha / beta) * (l_crit - l_inf) ** (1 - alpha / beta)) /
                   (alpha * (alpha - beta)))
-        t, c_crit, l_crit = c_curves(c0=c0_crit, rho=rho, alpha=alpha, l0=l0_crit, beta=beta, firstnodes=[i for i in range(83)])
-        ax.plot(l_crit[:, 26], c_crit[:, 26], linewidth=2, label=r'$p_0 = p_{crit}$')
+        p2 = c0_crit + 0.01
+        p3 = c0_crit - 0.01
+
+        # Integrate the three trajectories (all nodes seeded) in a single batched run
+        c0s = np.stack([np.full(nv, c0_crit), np.full(nv, p2), np.full(nv, p3)])
+        t, c_batch, l_batch = cached_c_curves(c0=c0s, rho=rho, alpha=alpha, l0=l0_crit, beta=beta)
+
+        ax.plot(l_batch[:, 0, 26], c_batch[:, 0, 26], linewidth=2, rasterized=True, label=r'$p_0 = p_{crit}$')
         ax.scatter(l0_crit, c0_crit, color='red')
         ax.text(l0_crit, c0_crit, r'($\lambda_0$, p_$crit$($\lambda_0$))', color='black', verticalalignment='center', horizontalalignment='left', fontsize=14)
 
-        p2 = c0_crit + 0.01
-        _, c_2, l_2 = c_curves(c0=p2, rho=rho, alpha=alpha, l0=l0_crit, beta=beta, firstnodes=[i for i in range(83)])
-        ax.plot(l_2[:, 26], c_2[:, 26], linewidth=2, label=r'$p_0 > p_{crit}$')
+        ax.plot(l_batch[:, 1, 26], c_batch[:, 1, 26], linewidth=2, rasterized=True, label=r'$p_0 > p_{crit}$')
         ax.scatter(l0_crit, p2, color='red')
         ax.text(l0_crit, p2, r'($\lambda_0$, p_$crit$($\lambda_0$)+0.01)', color='black', verticalalignment='bottom',
                 horizontalalignment='left', fontsize=14)
 
-        p3 = c0_crit - 0.01
-        _, c_3, l_3 = c_curves(c0=p3, rho=rho, alpha=alpha, l0=l0_crit, beta=beta, firstnodes=[i for i in range(83)])
-        ax.plot(l_3[:, 26], c_3[:, 26], linewidth=2, label=r'$p_0 < p_{crit}$')
+        ax.plot(l_batch[:, 2, 26], c_batch[:, 2, 26], linewidth=2, rasterized=True, label=r'$p_0 < p_{crit}$')
         ax.scatter(l0_crit, p3, color='red', label='Initial conditions')
         ax.text(l0_crit, p3, r'($\lambda_0$, p_$crit$($\lambda_0$)-0.01)', color='black', verticalalignment='top',
                 horizontalalignment='left', fontsize=14)
@@ -114,7 +122,7 @@ def phaseplot(alpha=2.1, rho=0.01, l_crit=0.72, l_inf=0.01, l0_crit=1.4, beta=1,
     if save:
         output_path = Path("results") / "phase_plane.png"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=300)
+        plt.savefig(output_path, dpi=150, metadata={"Software": None}, bbox_inches="tight")
         print(f"✅ Saved plot to: {output_path.resolve()}")
     else:
         plt.show()
@@ -127,9 +135,11 @@ def main():
     parser.add_argument("--beta", type=float, default=1, help=r"Global kinetic constant representing node vulnerability $\beta$")
     parser.add_argument("--rho", type=float, default=0.01, help=r"Effective diffusion coefficient")
     parser.add_argument("--save", action="store_true", help=r"Save plot as png")
+    parser.add_argument("--latex", action="store_true", help=r"Render plot text with LaTeX")
     
     args = parser.parse_args()
-    phaseplot(l0_crit=args.l0_crit, alpha=args.alpha, beta=args.beta, rho=args.rho, save=args.save)
+    phaseplot(l0_crit=args.l0_crit, alpha=args.alpha, beta=args.beta, rho=args.rho, save=args.save,
+              use_tex=args.latex)
 
 
 if __name__ == "__main__":
@@ -10,7 +10,6 @@ Date: 2024-04
 """
 
 import argparse
-import numpy as np
 from pathlib import Path
 import matplotlib.pyplot as plt
 from src.data.preprocessing import *
@@ -20,7 +19,8 @@ from src.models.tau_concentration_models import  c_curves
 def plot_regimes_comparison(
         tmax: int = 40,
         save: bool = False,
-        output_path: Path = None
+        output_path: Path = None,
+        use_tex: bool = False
 ) -> None:
     """
     Plot average tau concentration per Braak stage under two parameter regimes.
@@ -33,6 +33,8 @@ def plot_regimes_comparison(
         If True, saves the figure to `output_path`. Default is False.
     output_path : Path, optional
         Where to save the figure if `save=True`. If None, uses "results/regimes_plot.png".
+    use_tex : bool, optional
+        If True, text is rendered with LaTeX (slow) instead of mathtext. Default is False.
     :return:
     """
     # Run both simulations
@@ -40,16 +42,20 @@ def plot_regimes_comparison(
     _, c_growth = c_curves(tmax=40, alpha=2.1, rho=0.01, mass_conservation=False, clearance=False)
 
     # Plotting settings and figure
-    plt.rc('text', usetex=True)
+    plt.rc('text', usetex=use_tex)
     plt.rc('font', family='serif')
     plt.rcParams.update({'font.size': 19})
     colorcitos1 = iter(['#dc3e04', '#451ddc', '#01dc04', '#dc01d9', '#000000', '#ffa11b', '#1a7c25'])
     colorcitos2 = iter(['#dc3e04', '#451ddc', '#01dc04', '#dc01d9', '#000000', '#ffa11b', '#1a7c25'])
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 6))
 
+    # Mean concentration per Braak stage, all stages at once
+    zm_diff = c_diff @ braak_avg.T
+    zm_growth = c_growth @ braak_avg.T
+
     # Plot diffusion-dominated regime
-    for idx, zone in enumerate(braak):
-        ax1.plot(t, np.mean(c_diff[:, np.array(zone) - 1], axis=1),
+    for idx in range(len(braak)):
+        ax1.plot(t, zm_diff[:, idx],
                  color=braakcolors[idx], linewidth=2)
     ax1.set_facecolor("#d9e9f9")
     ax1.grid(color="white", linestyle='-', linewidth=1)
@@ -58,9 +64,9 @@ def plot_regimes_comparison(
     ax1.set_xlabel('Time (yrs)')
 
     # Plot growth-dominated regime
-    for idx, zone in enumerate(braak):
+    for idx in range(len(braak)):
         label = f"Braak stage {braaknames[idx]}"
-        ax2.plot(t, np.mean(c_growth[:, np.array(zone) - 1], axis=1),
+        ax2.plot(t, zm_growth[:, idx],
                  color=braakcolors[idx], linewidth=2, label=label)
     ax2.legend(loc='center left', bbox_to_anchor=(0.3, 0.4), fancybox=False, shadow=False, fontsize=18)
     ax2.set_facecolor("#d9e9f9")
@@ -75,7 +81,7 @@ def plot_regimes_comparison(
         if output_path is None:
             output_path = Path("results") / "regimes_plot.png"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=300)
+        plt.savefig(output_path, dpi=150, metadata={"Software": None}, bbox_inches="tight")
         print(f"✅ Saved plot to: {output_path.resolve()}")
     else:
         plt.show()
@@ -89,11 +95,13 @@ def main():
                         help="Save the plot to a file instead of displaying.")
     parser.add_argument("--out", type=str, default=None,
                         help="Custom path to save the plot. Default: results/regimes_plot.png")
+    parser.add_argument("--latex", action="store_true",
+                        help="Render plot text with LaTeX.")
 
     args = parser.parse_args()
 
     output_path = Path(args.out) if args.out else None
-    plot_regimes_comparison(tmax=args.tmax, save=args.save, output_path=output_path)
+    plot_regimes_comparison(tmax=args.tmax, save=args.save, output_path=output_path, use_tex=args.latex)
 
 
 if __name__ == "__main__":
@@ -16,6 +16,106 @@ import argparse
 import numpy as np
 from pathlib import Path
 import matplotlib.pyplot as plt
+from numba import njit, prange
+from scipy.integrate import solve_ivp
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _run_star(N, seeds, l0, rho, alpha, beta, l_crit, l_inf, dt, nsteps):
+    """
+    Integrate the coupled FKPP-clearance model on a star graph for a batch of central seedings.
+
+    All seeds are advanced together on a (len(seeds), N) state, one row per seed. The star
+    Laplacian is applied in closed form, (Lc)_0 = (N-1) c_0 - sum_{i>0} c_i and
+    (Lc)_i = c_i - c_0 for i > 0, so each step costs O(N) per seed and no matrix is built.
+
+    Returns the clearance value at the central node at the final timestep, for each seed.
+    """
+    S = len(seeds)
+
+    # Only the current and next states are kept; the trajectory itself is never needed
+    c_prev = np.zeros((S, N))
+    l_prev = np.full((S, N), l0, dtype=np.float64)
+    c_new = np.empty((S, N))
+    l_new = np.empty((S, N))
+
+    c_prev[:, 0] = seeds
+
+    for i in range(1, nsteps):
+        for s in range(S):
+            sum_periphery = 0.0
+            for j in range(1, N):
+                sum_periphery += c_prev[s, j]
+
+            for j in range(N):
+                if j == 0:
+                    lap_c = (N - 1) * c_prev[s, 0] - sum_periphery
+                else:
+                    lap_c = c_prev[s, j] - c_prev[s, 0]
+                c_new[s, j] = c_prev[s, j] + dt * (
+                    -rho * lap_c
+                    + (l_crit - l_prev[s, j]) * c_prev[s, j]
+                    - alpha * c_prev[s, j]**2
+                )
+                l_new[s, j] = l_prev[s, j] + dt * beta * c_prev[s, j] * (l_inf - l_prev[s, j])
+        c_prev, c_new = c_new, c_prev
+        l_prev, l_new = l_new, l_prev
+
+    return l_prev[:, 0].copy()
+
+
+@njit(cache=True, parallel=True)
+def _run_all(ns, seeds, l0, rho, alpha, beta, l_crit, l_inf, dt, nsteps):
+    """
+    Run `_run_star` on the whole seed sweep for every graph size, with sizes distributed across threads.
+
+    The number of worker threads is controlled by the `NUMBA_NUM_THREADS` environment variable.
+    """
+    l_final = np.zeros((len(ns), len(seeds)))  # rows: graphs, cols: seeds
+
+    for k in prange(len(ns)):
+        l_final[k, :] = _run_star(ns[k], seeds, l0, rho, alpha, beta, l_crit, l_inf, dt, nsteps)
+
+    return l_final
+
+
+def _run_star_lsoda(N, seeds, l0, rho, alpha, beta, l_crit, l_inf, tmax):
+    """
+    Same as `_run_star`, but integrated with SciPy's adaptive LSODA solver and an analytic Jacobian.
+
+    Returns the clearance value at the central node at time `tmax`, for each seed.
+    """
+    lap = np.eye(N)
+    lap[0, :] = -1
+    lap[:, 0] = -1
+    lap[0, 0] = N - 1
+    diag = np.arange(N)
+
+    def rhs(t, y):
+        c, l = y[:N], y[N:]
+        return np.concatenate([-rho * (lap @ c) + (l_crit - l) * c - alpha * c**2,
+                               beta * c * (l_inf - l)])
+
+    def jac(t, y):
+        c, l = y[:N], y[N:]
+        J = np.zeros((2 * N, 2 * N))
+        J[:N, :N] = -rho * lap
+        J[diag, diag] += l_crit - l - 2 * alpha * c
+        J[diag, N + diag] = -c
+        J[N + diag, diag] = beta * (l_inf - l)
+        J[N + diag, N + diag] = -beta * c
+        return J
+
+    l_final = np.empty(len(seeds))
+    for s, seed in enumerate(seeds):
+        y0 = np.concatenate([np.zeros(N), np.full(N, l0, dtype=np.float64)])
+        y0[0] = seed
+        sol = solve_ivp(rhs, (0, tmax), y0, method="LSODA", jac=jac, rtol=1e-8, atol=1e-10)
+        if not sol.success:
+            raise RuntimeError(f"LSODA integration failed: {sol.message}")
+        l_final[s] = sol.y[N, -1]
+
+    return l_final
 
 
 def simulate_star_graph_seeding(
@@ -30,7 +130,9 @@ def simulate_star_graph_seeding(
         dt: float = 0.1,
         seed_resolution: int = 30,
         save: bool = False,
-        output_path: Path = None
+        output_path: Path = None,
+        use_tex: bool = False,
+        method: str = "euler"
 ) -> None:
     """
     Run FKPP simulations on star graphs with increasing node count.
@@ -51,39 +153,25 @@ def simulate_star_graph_seeding(
         Whether to save the plot. Default is False
     output_path : Path, optional
         Path to save figure if `save=True`.
+    use_tex : bool, optional
+        Whether to render text with LaTeX (slow) instead of mathtext. Default is False.
+    method : str, optional
+        "euler" for the fixed-step explicit Euler scheme, or "lsoda" for SciPy's adaptive
+        LSODA solver, which ignores `dt`. Default is "euler".
     """
     t_vals = np.arange(0, tmax, step=dt)
     seeds = np.linspace(0, 1, seed_resolution)
-    l_final = np.zeros((len(ns), len(seeds)))  # rows: graphs, cols: seeds
-
-    for k, N in enumerate(ns):
-        # Build star graph Laplacian
-        w = np.zeros((N, N))
-        w[0, 1:] = 1
-        w[1:, 0] = 1
-        d = np.diag(w @ np.ones(N))
-        lap = d - w
-
-        for j, c0 in enumerate(seeds):
-            c = np.zeros((len(t_vals), N))
-            l = np.zeros((len(t_vals), N))
-
-            c[0, 0] = c0
-            l[0, :] = l0
-
-            for i in range(1, len(t_vals)):
-                c_prev, l_prev = c[i - 1], l[i - 1]
-                c[i] = c_prev + dt * (
-                    -rho * (lap @ c_prev.T)
-                    + (l_crit - l_prev) * c_prev
-                    - alpha * c_prev**2
-                )
-                l[i] = l_prev + dt * beta * c_prev * (l_inf - l_prev)
-
-            l_final[k, j] = l[-1, 0]
+    if method == "lsoda":
+        l_final = np.array([_run_star_lsoda(N, seeds, l0, rho, alpha, beta, l_crit, l_inf, t_vals[-1])
+                            for N in ns])
+    elif method == "euler":
+        l_final = _run_all(np.asarray(ns, dtype=np.int64), seeds, l0, rho, alpha, beta,
+                           l_crit, l_inf, dt, len(t_vals))  # rows: graphs, cols: seeds
+    else:
+        raise ValueError(f"Unknown integration method '{method}', expected 'euler' or 'lsoda'")
 
     # Plotting
-    plt.rc("text", usetex=True)
+    plt.rc("text", usetex=use_tex)
     plt.rc("font", family="serif")
     plt.rcParams.update({"font.size": 20})
 
@@ -104,7 +192,7 @@ def simulate_star_graph_seeding(
         if output_path is None:
             output_path = Path("results") / "star_graph_seeding.png"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=300)
+        plt.savefig(output_path, dpi=150, metadata={"Software": None}, bbox_inches="tight")
         print(f"✅ Plot saved to: {output_path.resolve()}")
     else:
         plt.show()
@@ -117,6 +205,8 @@ def main():
     parser.add_argument("--l0", type=float, default=2.0, help="Initial clearance (default: 2)")
     parser.add_argument("--save", action="store_true", help="Save the plot to disk.")
     parser.add_argument("--out", type=str, default=None, help="Custom output path (default: results/star_graph_seeding.png)")
+    parser.add_argument("--latex", action="store_true", help="Render plot text with LaTeX.")
+    parser.add_argument("--method", choices=["euler", "lsoda"], default="euler", help="Time integrator (default: euler)")
 
     args = parser.parse_args()
     output_path = Path(args.out) if args.out else None
@@ -126,7 +216,9 @@ def main():
         dt=args.dt,
         l0=args.l0,
         save=args.save,
-        output_path=output_path
+        output_path=output_path,
+        use_tex=args.latex,
+        method=args.method
     )
 
 
@@ -12,15 +12,15 @@ Date: 2024-04
 """
 
 import argparse
-import numpy as np
 from pathlib import Path
 import matplotlib.pyplot as plt
 
 from src.data.preprocessing import *
-from src.models.tau_concentration_models import c_curves, dt
+from src.models.tau_concentration_models import c_curves
 
 
-def run_timescale_analysis(tmax: int = 40, alpha: float = 2.1, rho: float = 0.01, save: bool=False) -> None:
+def run_timescale_analysis(tmax: int = 40, alpha: float = 2.1, rho: float = 0.01, save: bool=False,
+                           use_tex: bool = False) -> None:
     """
     Compute biomarker dynamics of FKPP model for initial tau seeding
     in each Braak stage.
@@ -35,33 +35,28 @@ def run_timescale_analysis(tmax: int = 40, alpha: float = 2.1, rho: float = 0.01
         Effective diffusion coefficient. Default is 0.01.
     save : bool, optional
         Whether to save the figure as png. Default is False.
+    use_tex : bool, optional
+        Whether to render text with LaTeX (slow) instead of mathtext. Default is False.
     """
-    # Time resolution
-    n_steps = round(tmax / dt)
-
     # Output dictionaries
     cs = {}
     mins_maxs = {}
 
-    for idx, zone in enumerate(braak):
-        # Initialise average and range trackers
-        c_accum = np.zeros(n_steps)
-        c_min = np.ones(n_steps) * np.inf
-        c_max = np.ones(n_steps) * -np.inf
+    # Seed every node independently, integrating all seedings in a single batch
+    configs = [[node] for node in range(nv)]
+    t, _, ctot_all = c_curves(alpha=alpha, rho=rho, firstnodes_batch=configs, tmax=tmax,
+                              clearance=False, c_tot=True)
 
-        for node in range(nv):
-            if node + 1 in zone:  # node indices start at 1 in braak
-                t, _, ctot = c_curves(alpha=alpha, rho=rho, firstnodes=node, tmax=tmax, clearance=False, c_tot=True)
-                c_accum += ctot
-                c_min = np.minimum(c_min, ctot)
-                c_max = np.maximum(c_max, ctot)
+    for idx, zone in enumerate(braak):
+        # Select the seedings that start in this zone
+        ctot_batch = ctot_all[:, braak_idx[idx]]
 
-        cs[idx] = c_accum / len(zone)
-        mins_maxs[idx] = (c_min, c_max)
+        cs[idx] = ctot_batch.sum(axis=1) / len(zone)
+        mins_maxs[idx] = (ctot_batch.min(axis=1), ctot_batch.max(axis=1))
 
     # Plotting
     plt.figure(figsize=(10, 6))
-    plt.rc("text", usetex=True)
+    plt.rc("text", usetex=use_tex)
     plt.rc("font", family="serif")
     plt.rcParams.update({"font.size": 19})
 
@@ -84,7 +79,7 @@ def run_timescale_analysis(tmax: int = 40, alpha: float = 2.1, rho: float = 0.01
     if save:
         output_path = Path("results") / "timescales_by_seeding_region.png"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        plt.savefig(output_path, dpi=300)
+        plt.savefig(output_path, dpi=150, metadata={"Software": None}, bbox_inches="tight")
         print(f"✅ Plot saved to: {output_path.resolve()}")
     else:
         plt.show()
@@ -96,9 +91,10 @@ def main():
     parser.add_argument("--alpha", type=float, default=2.1, help="Reaction rate (default: 2.1)")
     parser.add_argument("--rho", type=float, default=0.01, help="Diffusion coefficient (default: 0.01)")
     parser.add_argument("--save", action="store_true", help="Save figure as png")
+    parser.add_argument("--latex", action="store_true", help="Render plot text with LaTeX")
     args = parser.parse_args()
 
-    run_timescale_analysis(tmax=args.tmax, alpha=args.alpha, rho=args.rho, save=args.save)
+    run_timescale_analysis(tmax=args.tmax, alpha=args.alpha, rho=args.rho, save=args.save, use_tex=args.latex)
 
 
 if __name__ == "__main__":
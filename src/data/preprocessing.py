@@ -11,16 +11,18 @@ This module loads and defines constants and structures used across the project:
 - Label by Braak stage
 
 All constants defined here are imported throughout the simulation, modelling, and
-analysis pipelines.
+analysis pipelines. The CSV-backed data (`A`, `volumes`, `positions`, `lap`, `lap_sp`) is only
+read from disk the first time it is accessed. These names are left out of `__all__`, since a star
+import would load them all; read them as attributes instead, e.g. `preprocessing.lap`.
 
 Author: Ismael Leal
 Date: 2024-04
 """
 
+import os
+import functools
 import numpy as np
-import pandas as pd
 from pathlib import Path
-import matplotlib.pyplot as plt
 
 
 # === Load Volumes and Connectivity Matrix ===
@@ -35,20 +37,63 @@ A2_file = DB_DIR / "A2.csv"
 # A1_file = DB_DIR / "A1.csv"
 # A0_file = DB_DIR / "A0.csv"
 
-# Load data
-volumes = pd.read_csv(volumes_file, header=None).iloc[:, -1].values         # Volumes
-positions = pd.read_csv(positions_file, header=None).iloc[:, -3:].values    # Positions
-A2 = pd.read_csv(A2_file, header=None)     # Connectivity matrix: A2_{ij} = n_{ij} / l^2_{ij}
-# A1 = pd.read_csv(A1_file, header=None)     # Connectivity matrix: A1_{ij} = n_{ij} / l_{ij}
-# A0 = pd.read_csv(A0_file, header=None)     # Connectivity matrix: A0_{ij} = n_{ij}
+# Binary copy of the parsed matrix, memory-mapped on subsequent runs
+A2_npy_file = DB_DIR / "A2.npy"
+
+
+def _load_npy(npy_file: Path, source_file: Path, build) -> np.ndarray:
+    """
+    Memory-map `npy_file`, (re)building it with `build()` whenever `source_file` is newer.
+
+    If the cache cannot be written (e.g. read-only checkout), the freshly built array is returned.
+    """
+    if not npy_file.exists() or npy_file.stat().st_mtime < source_file.stat().st_mtime:
+        array = build()
+        tmp_file = npy_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "wb") as f:
+                np.save(f, array)
+            os.replace(tmp_file, npy_file)
+        except OSError:
+            # Do not leave a partially written temporary file behind
+            tmp_file.unlink(missing_ok=True)
+            return array
+    return np.load(npy_file, mmap_mode="r")
+
+
+# Data is loaded lazily, on first access of the corresponding module attribute (see `__getattr__`)
+@functools.cache
+def load_volumes() -> np.ndarray:
+    """Volume of each node."""
+    return np.loadtxt(volumes_file, delimiter=",", usecols=(-1,), dtype=np.float64)
+
+
+@functools.cache
+def load_positions() -> np.ndarray:
+    """3D coordinates of each node."""
+    return np.loadtxt(positions_file, delimiter=",", usecols=(-3, -2, -1), dtype=np.float64)
+
+
+@functools.cache
+def load_A2() -> np.ndarray:
+    """Connectivity matrix: A2_{ij} = n_{ij} / l^2_{ij}."""
+    A2 = _load_npy(A2_npy_file, A2_file, lambda: np.loadtxt(A2_file, delimiter=",", dtype=np.float64))
+    if A2.shape != (nv, nv):
+        raise ValueError(f"{A2_file.name} is {A2.shape[0]}x{A2.shape[1]}, but its first row gives nv = {nv}")
+    return A2
+# A1 = np.loadtxt(A1_file, delimiter=",")     # Connectivity matrix: A1_{ij} = n_{ij} / l_{ij}
+# A0 = np.loadtxt(A0_file, delimiter=",")     # Connectivity matrix: A0_{ij} = n_{ij}
 
 # Default adjacency matrix
-A = A2
+load_A = load_A2
 
 
 # === Network Size ===
 
-nv = A.shape[0]
+# Counted from the first row of the (header-less) matrix alone, so that the Braak groupings do not
+# force a full load. `load_A2` checks it against the shape of the loaded matrix
+with open(A2_file) as f:
+    nv = f.readline().count(",") + 1
 
 
 # === Braak Stage Groupings ===
@@ -61,27 +106,39 @@ braak6 = np.array([10, 11, 16, 21, 22, 51, 52, 57, 62, 63])
 non_braak = np.array([35, 36, 37, 38, 39, 76, 77, 78, 79, 80])
 
 # Braak V is the leftover set
-braaks_set = set(braak1).union(braak2, braak3, braak4, braak6, non_braak)
-nodes_set = set(range(1, nv+1))
-braak5 = list(nodes_set - braaks_set)
+labelled = np.concatenate([braak1, braak2, braak3, braak4, braak6, non_braak])
+unlabelled_mask = np.ones(nv, dtype=bool)
+unlabelled_mask[labelled - 1] = False
+braak5 = np.flatnonzero(unlabelled_mask) + 1
 
-braak = [braak1, braak2, braak3, braak4, braak5, braak6, non_braak]
+braak = (braak1, braak2, braak3, braak4, braak5, braak6, non_braak)
+
+# Zero-based node indices per Braak stage, for direct indexing of concentration arrays
+braak_idx = tuple(np.asarray(zone, dtype=np.intp) - 1 for zone in braak)
+
+# Braak stage (as an index into `braak`) of every node
+node_to_zone = np.full(nv, -1, dtype=np.int8)
+for k, zone_idx in enumerate(braak_idx):
+    node_to_zone[zone_idx] = k
+
+# Averaging matrix: `c @ braak_avg.T` gives the mean concentration of every Braak stage at once
+braak_avg = np.zeros((len(braak), nv))
+for k, zone_idx in enumerate(braak_idx):
+    braak_avg[k, zone_idx] = 1.0 / len(zone_idx)
 
 
 # === Braak Colours and Names ===
 
-# Use consistent matplotlib colormap
-colors = plt.cm.get_cmap('tab10', 10)
-braakcolors = [
+# Hex values of the matplotlib 'tab10' colours previously looked up for each stage
+braakcolors = (
     "#dc3e04",
-    colors(2),
-    colors(8),
-    colors(4),
-    colors(5),
-    colors(10),
-    colors(7)
-
-]
+    "#2ca02c",  # tab10(2)
+    "#bcbd22",  # tab10(8)
+    "#9467bd",  # tab10(4)
+    "#8c564b",  # tab10(5)
+    "#17becf",  # tab10(10), clipped to the last colour of the map
+    "#7f7f7f",  # tab10(7)
+)
 braaknames = {
     0: 'Braak stage I',
     1: 'Braak stage II',
@@ -95,7 +152,39 @@ braaknames = {
 
 # === Laplacian ===
 
-D = np.diag(A @ np.ones(nv))    # Degree matrix (sum of weights connected to each node in the diagonal)
-lap = D - A                     # Laplacian
+@functools.cache
+def load_laplacian() -> np.ndarray:
+    """Graph Laplacian D - A, where D is the diagonal matrix of node degrees (weighted)."""
+    A = load_A()
+    lap = -A
+    # Adding the degrees in place avoids building the dense diagonal matrix D
+    np.fill_diagonal(lap, lap.diagonal() + A.sum(axis=1))
+    return lap
+
+
+@functools.cache
+def load_laplacian_sparse() -> "scipy.sparse.csr_matrix":
+    """Graph Laplacian in CSR format, for sparse matrix-vector products."""
+    # Imported here, since scipy.sparse takes longer to import than the data itself takes to load
+    import scipy.sparse as sp
+    return sp.csr_matrix(load_laplacian())
+
+
+# Lazily loaded module attributes (PEP 562)
+_lazy_attributes = {
+    "A": load_A,
+    "A2": load_A2,
+    "lap": load_laplacian,
+    "lap_sp": load_laplacian_sparse,
+    "volumes": load_volumes,
+    "positions": load_positions,
+}
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        return _lazy_attributes[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["A", "lap", "volumes", "positions", "nv", "braak", "braakcolors", "braaknames"]
+__all__ = ["nv", "braak", "braak_idx", "node_to_zone", "braak_avg", "braakcolors", "braaknames"]
@@ -15,7 +15,6 @@ Date: 2024-04
 """
 
 import argparse
-import numpy as np
 from pathlib import Path
 import matplotlib.pyplot as plt
 
@@ -28,7 +27,8 @@ def plot_model_comparison(
         l0: float = 0.1,
         tmax: int = 100,
         kappa: float = 0.9,
-        save: bool = False
+        save: bool = False,
+        use_tex: bool = False
 ):
     """
     Plots comparison of all models shown in the project report.
@@ -45,6 +45,8 @@ def plot_model_comparison(
         Exponential damage parameter (used in mod_lap="exp"). Default is 1.0.
     save: bool, optional
         Whether to save the figure. Default is False.
+    use_tex : bool, optional
+        Whether to render text with LaTeX (slow) instead of mathtext. Default is False.
     """
     # Run all models
     results = run_all_models(c0=c0, l0=l0, tmax=tmax, kappa=kappa)
@@ -54,7 +56,7 @@ def plot_model_comparison(
     line_styles = ["dotted", "solid", "dashed", "dashdot"]
 
     # Plotting configuration
-    plt.rc("text", usetex=True)
+    plt.rc("text", usetex=use_tex)
     plt.rc("font", family="serif")
     plt.rcParams.update({"font.size": 20})
     fig, ax = plt.subplots(1, 1, figsize=(10, 6))
@@ -66,9 +68,9 @@ def plot_model_comparison(
     for i, (model, name, style) in enumerate(zip(model_outputs, model_names, line_styles)):
         color_cycle = iter(["#dc3e04", "#451ddc", "#01dc04", "#dc01d9",
                             "#583419", "#ffa11b", "#d1dc00"])
-        for zone in braak:
-            ax.plot(t, np.mean(model[:, np.array(zone) - 1], axis=1),
-                    color=next(color_cycle), linewidth=2, linestyle=style)
+        zone_means = model @ braak_avg.T     # Mean of every Braak zone in a single product
+        for zone_mean in zone_means.T:
+            ax.plot(t, zone_mean, color=next(color_cycle), linewidth=2, linestyle=style)
         legend_model_handles.append(
             plt.Line2D([], [], linestyle=style, color="black", label=name)
         )
@@ -103,8 +105,9 @@ def plot_model_comparison(
 def main():
     parser = argparse.ArgumentParser(description="Compare different tau propagation models.")
     parser.add_argument("--save", action="store_true", help="Save the figure to png.")
+    parser.add_argument("--latex", action="store_true", help="Render plot text with LaTeX.")
     args = parser.parse_args()
-    plot_model_comparison(save=args.save)
+    plot_model_comparison(save=args.save, use_tex=args.latex)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+"""
+Disk Cache for Tau Concentration Simulations
+
+This module memoises `c_curves` on disk. Each call is keyed on its keyword arguments
+together with a digest of the model and preprocessing source files and of the Laplacian
+and node volumes, so editing the model or the connectome data invalidates every stored
+solution. Results are stored as `.npz` files under `.cache/c_curves/`.
+"""
+
+import hashlib
+import os
+import numpy as np
+from pathlib import Path
+
+from src.data import preprocessing
+from src.data.preprocessing import ROOT
+from src.models import tau_concentration_models
+from src.models.tau_concentration_models import c_curves
+
+CACHE_DIR = ROOT / ".cache" / "c_curves"
+MODEL_FILE = Path(tau_concentration_models.__file__)
+PREPROCESSING_FILE = Path(preprocessing.__file__)
+
+
+def _cache_key(kwargs: dict) -> str:
+    """
+    Hash the keyword arguments of a `c_curves` call, the model inputs and sources into a filename stem.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for source_file in (MODEL_FILE, PREPROCESSING_FILE):
+        with open(source_file, "rb") as f:
+            h.update(hashlib.file_digest(f, "blake2b").digest())
+
+    # The loaded data, so that edits to databases/*.csv or to `load_A` are picked up as well
+    h.update(preprocessing.lap.tobytes())
+    h.update(preprocessing.volumes.tobytes())
+
+    for name, value in sorted(kwargs.items()):
+        h.update(name.encode())
+        if isinstance(value, np.ndarray):
+            # Arrays are keyed on their contents rather than their (possibly truncated) repr
+            h.update(str((value.dtype, value.shape)).encode())
+            h.update(np.ascontiguousarray(value).tobytes())
+        else:
+            h.update(repr(value).encode())
+
+    return h.hexdigest()
+
+
+def cached_c_curves(**kwargs) -> list:
+    """
+    Drop-in replacement for `c_curves` that reuses previously computed solutions.
+
+    Calls that request a plot are always recomputed, since the plot is a side effect
+    that cannot be replayed from the stored arrays.
+
+    Parameters
+    ----------
+    **kwargs
+        Keyword arguments forwarded to `c_curves`.
+
+    Returns
+    -------
+    vals : list
+        Same list of arrays as returned by `c_curves(**kwargs)`.
+    """
+    if kwargs.get("plot_c", False):
+        return c_curves(**kwargs)
+
+    path = CACHE_DIR / f"{_cache_key(kwargs)}.npz"
+    if path.exists():
+        with np.load(path) as data:
+            return [data[f"arr_{i}"] for i in range(len(data.files))]
+
+    vals = c_curves(**kwargs)
+
+    # Write to a temporary file first so concurrent runs never read a partial cache entry
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(f, *vals)
+    os.replace(tmp_path, path)
+
+    return vals
+
+
+__all__ = ["cached_c_curves"]
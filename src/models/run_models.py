@@ -15,19 +15,20 @@ Date: 2024-04
 """
 
 # === Imports ===
-import matplotlib.pyplot as plt
+import functools
+from concurrent.futures import ProcessPoolExecutor
 from src.models.tau_concentration_models import c_curves
 
 
-# === Plotting Settings ===
-plt.rc("text", usetex=True)
-plt.rc("font", family="serif")
-plt.rcParams.update({"font.size": 20})
-
-def run_all_models(c0: float = 0.2, l0: float = 0.1, tmax: int = 100, kappa: float = 1.0) -> dict:
+def run_all_models(c0: float = 0.2, l0: float = 0.1, tmax: int = 100, kappa: float = 1.0,
+                   max_workers: int = 1) -> dict:
     """
     Run the FKPP model and its extensions under a shared set of parameters.
 
+    The four simulations are independent, so for long runs they can be spread over a pool of
+    worker processes. At the default `tmax` each run takes milliseconds, far less than starting
+    the workers (which re-import numba and scipy), so they run sequentially by default.
+
     Parameters
     ----------
     c0 : float, optional
@@ -38,6 +39,9 @@ def run_all_models(c0: float = 0.2, l0: float = 0.1, tmax: int = 100, kappa: flo
         Maximum simulation time (years). Default is 100.
     kappa : float, optional
         Exponential damage parameter (used in mod_lap="exp"). Default is 1.0.
+    max_workers : int, optional
+        Number of worker processes. If 1, the models are run sequentially in the current
+        process. Default is 1.
 
     Returns
     -------
@@ -45,31 +49,29 @@ def run_all_models(c0: float = 0.2, l0: float = 0.1, tmax: int = 100, kappa: flo
         Dictionary with time vector `t` and concentration matrices for each model variant.
         Keys: "t", "fkpp", "coupled", "linear", "exp"
     """
-    # FKPP (no clearance or damage)
-    t, c_fkpp = c_curves(c0=c0, clearance=False, tmax=tmax)
-
-    # Coupled concentration–clearance
-    _, c_coupled, _ = c_curves(c0=c0, l0=l0, tmax=tmax)
-
-    # Linearly modulated damage in connectivity
-    _, c_linear, _, _ = c_curves(
-        c0=c0, l0=l0, tmax=tmax,
-        mod_lap="linear", lap_ani=True, plot_c=False
-    )
+    # Partials of the top-level `c_curves` can be pickled, so they can be sent to worker processes
+    model_runs = {
+        # FKPP (no clearance or damage)
+        "fkpp": functools.partial(c_curves, c0=c0, clearance=False, tmax=tmax),
+        # Coupled concentration–clearance
+        "coupled": functools.partial(c_curves, c0=c0, l0=l0, tmax=tmax),
+        # Linearly modulated damage in connectivity
+        "linear": functools.partial(c_curves, c0=c0, l0=l0, tmax=tmax, mod_lap="linear"),
+        # Exponentially modulated damage in connectivity
+        "exp": functools.partial(c_curves, c0=c0, l0=l0, tmax=tmax, mod_lap="exp", kappa=kappa),
+    }
 
-    # Exponentially modulated damage in connectivity
-    _, c_exp, _, _ = c_curves(
-        c0=c0, l0=l0, tmax=tmax,
-        mod_lap="exp", kappa=kappa, lap_ani=True, plot_c=False
-    )
+    if max_workers == 1:
+        outputs = {name: run() for name, run in model_runs.items()}
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(run) for name, run in model_runs.items()}
+            outputs = {name: future.result() for name, future in futures.items()}
 
-    return {
-        "t": t,
-        "fkpp": c_fkpp,
-        "coupled": c_coupled,
-        "linear": c_linear,
-        "exp": c_exp
-    }
+    # Every variant returns the time vector and the concentrations first
+    results = {"t": outputs["fkpp"][0]}
+    results.update({name: out[1] for name, out in outputs.items()})
+    return results
 
 
 __all__ = ["run_all_models"]
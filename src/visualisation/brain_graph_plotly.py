@@ -11,6 +11,7 @@ import argparse
 import networkx as nx
 import plotly.graph_objects as go
 
+from src.data import preprocessing
 from src.data.preprocessing import *
 
 
@@ -23,10 +24,11 @@ def plot_brain_graph(volume_scale: float = 200.0):
     volume_scale : float, optional
         Factor to scale down node volumes for visual clarity. Default is 400.
     """
-    scaled_volumes = volumes / volume_scale
-    G = nx.from_numpy_array(A.values)
+    scaled_volumes = preprocessing.volumes / volume_scale
+    G = nx.from_numpy_array(preprocessing.A)
 
     # Assign coordinates and sizes
+    positions = preprocessing.positions
     node_pos = {i+1: (positions[i, 0], positions[i, 1], positions[i, 2]) for i in range(nv)}
     node_vol = {i+1: scaled_volumes[i] for i in range(nv)}
 
@@ -44,17 +46,18 @@ def plot_brain_graph(volume_scale: float = 200.0):
             name=braaknames[idx]
         ))
 
-    # Add edges
-    for edge in G.edges():
-        x_coords, y_coords, z_coords = zip(*[node_pos[node + 1] for node in edge])
-        fig.add_trace(go.Scatter3d(
-            x=[x_coords[0], x_coords[1]],
-            y=[y_coords[0], y_coords[1]],
-            z=[z_coords[0], z_coords[1]],
-            mode="lines",
-            line=dict(color="grey", width=2),
-            showlegend=False
-        ))
+    # Add edges, all in a single trace with the segments separated by None
+    xe, ye, ze = [], [], []
+    for u, v in G.edges():
+        xe += [node_pos[u + 1][0], node_pos[v + 1][0], None]
+        ye += [node_pos[u + 1][1], node_pos[v + 1][1], None]
+        ze += [node_pos[u + 1][2], node_pos[v + 1][2], None]
+    fig.add_trace(go.Scatter3d(
+        x=xe, y=ye, z=ze,
+        mode="lines",
+        line=dict(color="grey", width=2),
+        showlegend=False
+    ))
 
     # Layout settings
     fig.update_layout(
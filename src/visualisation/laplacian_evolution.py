@@ -45,12 +45,10 @@ def plot_laplacian_heatmaps(c0: float = 0.2, l0: float = 0.1, tmax: int = 100,
     )
 
     # Extract snapshots
-    lap1 = laps[0]
-    lap2 = laps[len(laps) // 2]
-    lap3 = laps[-1]
+    snapshots = laps[[0, len(laps) // 2, -1]]
+    lap1, lap2, lap3 = snapshots
 
-    vmin = min(lap1.min().min(), lap2.min().min(), lap3.min().min())
-    vmax = max(lap1.max().max(), lap2.max().max(), lap3.max().max())
+    vmin, vmax = snapshots.min(), snapshots.max()
 
     # Plot
     fig, axs = plt.subplots(1, 3, figsize=(12, 6), constrained_layout=True)